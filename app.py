@@ -5,12 +5,20 @@ Built with Streamlit, Azure OpenAI, and Azure Text Analytics.
 """
 
 import streamlit as st
-import json
+import ijson
+import orjson
 import os
+import re
+import asyncio
+from pathlib import Path
 from datetime import datetime
 from dotenv import load_dotenv
+import numpy as np
+import pandas as pd
 import requests
-from typing import List, Dict, Tuple
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+from typing import List, Dict, Tuple, Iterator
 
 # ============================================================================
 # CONFIGURATION & SETUP
@@ -29,7 +37,7 @@ st.set_page_config(
 
 # Initialize session state
 if 'bookmarked_schemes' not in st.session_state:
-    st.session_state.bookmarked_schemes = []
+    st.session_state.bookmarked_schemes = set()
 
 if 'language' not in st.session_state:
     st.session_state.language = 'en'
@@ -41,7 +49,13 @@ if 'search_history' not in st.session_state:
     st.session_state.search_history = []
 
 if 'expanded_schemes' not in st.session_state:
-    st.session_state.expanded_schemes = []
+    st.session_state.expanded_schemes = set()
+
+if 'explanations' not in st.session_state:
+    st.session_state.explanations = {}
+
+if 'page' not in st.session_state:
+    st.session_state.page = 0
 
 # ============================================================================
 # AZURE AI SERVICES CONFIGURATION
@@ -50,27 +64,104 @@ if 'expanded_schemes' not in st.session_state:
 AZURE_OPENAI_API_KEY = os.getenv("AZURE_OPENAI_API_KEY")
 AZURE_OPENAI_ENDPOINT = os.getenv("AZURE_OPENAI_ENDPOINT")
 AZURE_OPENAI_DEPLOYMENT_NAME = os.getenv("AZURE_OPENAI_DEPLOYMENT_NAME", "gpt-35-turbo")
+AZURE_OPENAI_FALLBACK_DEPLOYMENT_NAME = os.getenv("AZURE_OPENAI_FALLBACK_DEPLOYMENT_NAME")
 AZURE_TEXTANALYTICS_KEY = os.getenv("AZURE_TEXTANALYTICS_KEY")
 AZURE_TEXTANALYTICS_ENDPOINT = os.getenv("AZURE_TEXTANALYTICS_ENDPOINT")
 
 # API version for Azure OpenAI
 AZURE_OPENAI_API_VERSION = "2023-05-15"
 
+# Throttling / transient server errors worth retrying
+RETRY_STATUS_CODES = [429, 500, 502, 503, 504]
+
+# Max documents per Text Analytics entity recognition request (service limit)
+TEXT_ANALYTICS_BATCH_SIZE = 5
+
+# Max schemes per batched eligibility prompt (larger batches degrade answer quality)
+EXPLANATION_BATCH_SIZE = 8
+
+# Max concurrent Azure OpenAI requests for per-scheme explanations
+EXPLANATION_MAX_CONCURRENCY = 10
+
+# Scheme cards rendered per results page
+RESULTS_PAGE_SIZE = 10
+
+# ============================================================================
+# HTTP SESSION
+# ============================================================================
+
+@st.cache_resource
+def get_http_session() -> requests.Session:
+    """
+    Shared HTTP session for all Azure calls.
+    Cached as a resource so keep-alive connections survive Streamlit reruns.
+    """
+    retry = Retry(
+        total=3,
+        backoff_factor=1.0,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=["POST"],
+        respect_retry_after_header=True,
+        raise_on_status=False  # Hand the last response back so raise_for_status() reports it
+    )
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry)
+    
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+_SESSION = get_http_session()
+
 # ============================================================================
 # DATA LOADING
 # ============================================================================
 
-@st.cache_data
+# Scheme fields used by the app; other fields in schemes.json are skipped at load
+SCHEME_FIELDS = ('id', 'name', 'ministry', 'category', 'beneficiary', 'benefit', 'description', 'source_url')
+
+# Keywords used for profile-to-scheme match scoring
+MATCH_KEYWORDS = (
+    'farmer', 'women', 'youth', 'student', 'senior', 'elder', 'msme', 'business',
+    'entrepreneur', 'girl', 'female', 'young', 'old', 'small', 'enterprise'
+)
+
+def find_keywords(text: str) -> frozenset:
+    """Return the match keywords contained in already-lowercased text."""
+    return frozenset(keyword for keyword in MATCH_KEYWORDS if keyword in text)
+
+@st.cache_resource
 def load_schemes() -> List[Dict]:
-    """Load schemes from JSON file."""
+    """
+    Stream schemes from JSON file, keeping only SCHEME_FIELDS, and precompute their
+    lowercased match text and match keywords.
+    Cached as a shared resource (no per-rerun copy): callers must not mutate the result.
+    """
     try:
-        with open('schemes.json', 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            return data.get('schemes', [])
+        with open('schemes.json', 'rb') as f:
+            schemes = []
+            
+            for item in ijson.items(f, 'schemes.item'):
+                scheme = {field: item[field] for field in SCHEME_FIELDS}
+                scheme['_search_text_lc'] = f"{scheme['name']} {scheme['beneficiary']} {scheme['category']}".lower()
+                scheme['_keywords'] = find_keywords(scheme['_search_text_lc'])
+                schemes.append(scheme)
+            
+            return schemes
     except FileNotFoundError:
         st.error("❌ schemes.json not found. Please ensure the file exists in the project directory.")
         return []
 
+@st.cache_resource
+def get_scheme_lookup() -> Dict[str, Dict]:
+    """Map scheme id to scheme, built once per process."""
+    return {scheme['id']: scheme for scheme in load_schemes()}
+
+@st.cache_resource
+def get_scheme_positions() -> Dict[str, int]:
+    """Map scheme id to its row in SCHEMES (and the keyword matrix), built once per process."""
+    return {scheme['id']: position for position, scheme in enumerate(load_schemes())}
+
 # Load schemes
 SCHEMES = load_schemes()
 
@@ -86,10 +177,78 @@ CATEGORIES = {
 
 CATEGORY_NAMES = list(CATEGORIES.keys())
 
+@st.cache_resource
+def get_filter_options() -> Tuple[List[str], List[str]]:
+    """Ministry and beneficiary dropdown options, built once per process."""
+    schemes = load_schemes()
+    ministry_options = ["All Ministries"] + sorted({s['ministry'] for s in schemes})
+    beneficiary_options = ["All Types"] + sorted({s['beneficiary'] for s in schemes})
+    return ministry_options, beneficiary_options
+
+MINISTRY_OPTIONS, BENEFICIARY_OPTIONS = get_filter_options()
+
 # ============================================================================
 # AZURE AI FUNCTIONS
 # ============================================================================
 
+# Request pieces that never change between calls
+_OAI_HEADERS = {
+    "Content-Type": "application/json",
+    "api-key": AZURE_OPENAI_API_KEY
+}
+
+_OAI_SYSTEM_MSG = {
+    "role": "system",
+    "content": "You are a helpful assistant that explains Indian government schemes in simple, non-legal language. Be concise and clear."
+}
+
+# Primary deployment first, then the fallback deployment if configured
+_OAI_URLS = [
+    f"{AZURE_OPENAI_ENDPOINT}/openai/deployments/{deployment}/chat/completions?api-version={AZURE_OPENAI_API_VERSION}"
+    for deployment in (AZURE_OPENAI_DEPLOYMENT_NAME, AZURE_OPENAI_FALLBACK_DEPLOYMENT_NAME)
+    if deployment
+]
+
+def _build_azure_openai_request(prompt: str, max_tokens: int) -> Dict:
+    """Build the body of an Azure OpenAI chat completion request."""
+    return {
+        "messages": [_OAI_SYSTEM_MSG, {"role": "user", "content": prompt}],
+        "temperature": 0.7,
+        "max_tokens": max_tokens,
+        "top_p": 0.95
+    }
+
+def _post_azure_openai(data: Dict, stream: bool = False) -> requests.Response:
+    """
+    POST a chat completion request. The session retries 429/5xx with backoff;
+    if the primary deployment still fails, the fallback deployment (if configured) is tried once.
+    """
+    body = orjson.dumps(data)
+    
+    for url in _OAI_URLS:
+        response = _SESSION.post(url, data=body, headers=_OAI_HEADERS, timeout=10, stream=stream)
+        if response.status_code not in RETRY_STATUS_CODES or url == _OAI_URLS[-1]:
+            break
+        response.close()
+    
+    response.raise_for_status()
+    return response
+
+def _call_azure_openai_uncached(prompt: str, max_tokens: int) -> str:
+    """
+    Send a chat completion request to Azure OpenAI.
+    Raises on request or response errors so failures are never cached.
+    """
+    response = _post_azure_openai(_build_azure_openai_request(prompt, max_tokens))
+    
+    result = orjson.loads(response.content)
+    return result['choices'][0]['message']['content'].strip()
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _call_azure_openai_cached(prompt: str, max_tokens: int) -> str:
+    """Azure OpenAI response cached by prompt, so reruns don't repeat identical calls."""
+    return _call_azure_openai_uncached(prompt, max_tokens)
+
 def call_azure_openai(prompt: str, max_tokens: int = 200) -> str:
     """
     Call Azure OpenAI API to generate responses.
@@ -99,82 +258,116 @@ def call_azure_openai(prompt: str, max_tokens: int = 200) -> str:
         return "⚠️ Azure OpenAI not configured. Please set your API credentials in .env file."
     
     try:
-        headers = {
-            "Content-Type": "application/json",
-            "api-key": AZURE_OPENAI_API_KEY
-        }
-        
-        data = {
-            "messages": [
-                {
-                    "role": "system",
-                    "content": "You are a helpful assistant that explains Indian government schemes in simple, non-legal language. Be concise and clear."
-                },
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
-            "temperature": 0.7,
-            "max_tokens": max_tokens,
-            "top_p": 0.95
-        }
-        
-        url = f"{AZURE_OPENAI_ENDPOINT}/openai/deployments/{AZURE_OPENAI_DEPLOYMENT_NAME}/chat/completions?api-version={AZURE_OPENAI_API_VERSION}"
-        
-        response = requests.post(url, json=data, headers=headers, timeout=10)
-        response.raise_for_status()
-        
-        result = response.json()
-        return result['choices'][0]['message']['content'].strip()
+        return _call_azure_openai_cached(prompt, max_tokens)
     
     except requests.exceptions.RequestException as e:
         return f"⚠️ Error calling Azure OpenAI: {str(e)}"
     except Exception as e:
         return f"⚠️ Unexpected error: {str(e)}"
 
-def analyze_text_azure(text: str) -> Dict:
+async def _call_azure_openai_async(client: 'httpx.AsyncClient', prompt: str, max_tokens: int) -> str:
     """
-    Analyze user input using Azure Text Analytics.
-    Extracts key entities and sentiment.
+    Send a chat completion request over a shared async HTTP/2 client.
+    Raises on request or response errors.
+    """
+    response = await client.post(
+        _OAI_URLS[0],
+        content=orjson.dumps(_build_azure_openai_request(prompt, max_tokens)),
+        headers=_OAI_HEADERS
+    )
+    response.raise_for_status()
+    
+    result = orjson.loads(response.content)
+    return result['choices'][0]['message']['content'].strip()
+
+def stream_azure_openai(prompt: str, max_tokens: int = 200) -> Iterator[str]:
+    """
+    Stream an Azure OpenAI response, yielding text chunks as they arrive.
+    Raises on request or response errors, including a stream that ends before
+    [DONE], so callers can tell a complete answer from a partial one.
+    """
+    data = _build_azure_openai_request(prompt, max_tokens)
+    data["stream"] = True
+    
+    with _post_azure_openai(data, stream=True) as response:
+        # Server-sent events: one "data: {...}" line per chunk, ending with "data: [DONE]"
+        for line in response.iter_lines():
+            if not line.startswith(b"data: "):
+                continue
+            
+            payload = line[len(b"data: "):]
+            if payload == b"[DONE]":
+                return
+            
+            for choice in orjson.loads(payload).get('choices', []):
+                content = choice.get('delta', {}).get('content')
+                if content:
+                    yield content
+    
+    raise ValueError("Azure OpenAI stream ended before [DONE]")
+
+def analyze_texts_azure(texts: List[str]) -> List[Dict]:
+    """
+    Analyze several texts using Azure Text Analytics, packing up to
+    TEXT_ANALYTICS_BATCH_SIZE documents into each request.
+    Extracts key entities. Returns one result per text, in input order.
     """
     if not all([AZURE_TEXTANALYTICS_KEY, AZURE_TEXTANALYTICS_ENDPOINT]):
-        return {"error": "Azure Text Analytics not configured"}
+        return [{"error": "Azure Text Analytics not configured"} for _ in texts]
     
-    try:
-        headers = {
-            "Content-Type": "application/json",
-            "Ocp-Apim-Subscription-Key": AZURE_TEXTANALYTICS_KEY
-        }
-        
-        data = {
-            "documents": [
-                {
-                    "id": "1",
-                    "language": "en",
-                    "text": text
-                }
-            ]
-        }
-        
-        url = f"{AZURE_TEXTANALYTICS_ENDPOINT}/text/analytics/v3.1/entities/recognition/general"
+    headers = {
+        "Content-Type": "application/json",
+        "Ocp-Apim-Subscription-Key": AZURE_TEXTANALYTICS_KEY
+    }
+    
+    url = f"{AZURE_TEXTANALYTICS_ENDPOINT}/text/analytics/v3.1/entities/recognition/general"
+    
+    results = []
+    
+    for start in range(0, len(texts), TEXT_ANALYTICS_BATCH_SIZE):
+        batch = texts[start:start + TEXT_ANALYTICS_BATCH_SIZE]
         
-        response = requests.post(url, json=data, headers=headers, timeout=10)
-        response.raise_for_status()
+        try:
+            data = {
+                "documents": [
+                    {
+                        "id": str(doc_id),
+                        "language": "en",
+                        "text": text
+                    }
+                    for doc_id, text in enumerate(batch, start)
+                ]
+            }
+            
+            response = _SESSION.post(url, data=orjson.dumps(data), headers=headers, timeout=10)
+            response.raise_for_status()
+            
+            result = orjson.loads(response.content)
+            by_id = {doc['id']: doc for doc in result.get('documents', [])}
+            by_id.update({doc['id']: {"error": doc['error']} for doc in result.get('errors', [])})
+            
+            results.extend(
+                by_id.get(str(doc_id), {"error": "No result returned for document"})
+                for doc_id in range(start, start + len(batch))
+            )
         
-        return response.json()
+        except requests.exceptions.RequestException as e:
+            results.extend({"error": f"Error calling Azure Text Analytics: {str(e)}"} for _ in batch)
+        except Exception as e:
+            results.extend({"error": f"Unexpected error: {str(e)}"} for _ in batch)
     
-    except requests.exceptions.RequestException as e:
-        return {"error": f"Error calling Azure Text Analytics: {str(e)}"}
-    except Exception as e:
-        return {"error": f"Unexpected error: {str(e)}"}
+    return results
 
-def generate_eligibility_explanation(scheme: Dict, user_profile: str) -> Tuple[str, int]:
+def analyze_text_azure(text: str) -> Dict:
     """
-    Generate AI-powered eligibility explanation and match score.
-    Returns: (explanation_text, match_score_percentage)
+    Analyze user input using Azure Text Analytics.
+    Extracts key entities.
     """
-    prompt = f"""
+    return analyze_texts_azure([text])[0]
+
+def build_eligibility_prompt(scheme: Dict, user_profile: str) -> str:
+    """Prompt asking the model why a user might be eligible for a scheme."""
+    return f"""
     Scheme Name: {scheme['name']}
     Ministry: {scheme['ministry']}
     Beneficiary Type: {scheme['beneficiary']}
@@ -189,783 +382,359 @@ def generate_eligibility_explanation(scheme: Dict, user_profile: str) -> Tuple[s
     
     Keep language simple and non-legal.
     """
-    
-    explanation = call_azure_openai(prompt, max_tokens=150)
+
+def generate_eligibility_explanation(scheme: Dict, user_profile: str) -> Tuple[str, int]:
+    """
+    Generate AI-powered eligibility explanation and match score.
+    Returns: (explanation_text, match_score_percentage)
+    """
+    explanation = call_azure_openai(build_eligibility_prompt(scheme, user_profile), max_tokens=150)
     
     # Calculate match score (in production, this would be more sophisticated)
     # For now, based on keyword matching
-    match_score = calculate_match_score(scheme, user_profile)
+    match_score = calculate_match_score(scheme, profile_keywords(user_profile))
     
     return explanation, match_score
 
-def calculate_match_score(scheme: Dict, user_profile: str) -> int:
-    """Calculate match percentage based on keyword matching."""
-    scheme_text = f"{scheme['name']} {scheme['beneficiary']} {scheme['category']}".lower()
-    profile_text = user_profile.lower()
-    
-    keywords = [
-        'farmer', 'women', 'youth', 'student', 'senior', 'elder', 'msme', 'business',
-        'entrepreneur', 'girl', 'female', 'young', 'old', 'small', 'enterprise'
-    ]
-    
-    matches = sum(1 for keyword in keywords if keyword in scheme_text and keyword in profile_text)
-    
-    # Base score + keyword matches
-    base_score = 50
-    additional_score = matches * 5
-    
-    return min(95, base_score + additional_score)  # Cap at 95%
+def generate_eligibility_explanation_stream(scheme: Dict, user_profile: str) -> Iterator[str]:
+    """Stream the eligibility explanation chunk by chunk; raises like stream_azure_openai."""
+    yield from stream_azure_openai(build_eligibility_prompt(scheme, user_profile), max_tokens=150)
 
-# ============================================================================
-# UI STYLING & EMBEDDED CSS
-# ============================================================================
+def _strip_code_fence(text: str) -> str:
+    """Unwrap a reply the model wrapped in a ``` / ```json code fence."""
+    match = re.fullmatch(r'```[\w-]*\s*(.*?)\s*```', text.strip(), flags=re.S)
+    return match.group(1) if match else text
 
-def inject_css():
-    """Inject custom CSS for modern UI with smooth animations."""
-    css = """
-    <style>
-    /* ============================================================================
-       GLOBAL STYLES
-       ============================================================================ */
-    
-    :root {
-        --primary-color: #1a3a52;
-        --accent-color: #ff6b35;
-        --accent-light: #f7931e;
-        --success-color: #10b981;
-        --warning-color: #f59e0b;
-        --background: #f5f7fa;
-        --card-bg: #ffffff;
-        --text-dark: #333333;
-        --text-light: #666666;
-        --border-light: #e5e7eb;
-        --shadow-sm: 0 1px 2px rgba(0, 0, 0, 0.05);
-        --shadow-md: 0 4px 6px rgba(0, 0, 0, 0.1);
-        --shadow-lg: 0 10px 15px rgba(0, 0, 0, 0.1);
-    }
-    
-    * {
-        margin: 0;
-        padding: 0;
-        box-sizing: border-box;
-    }
-    
-    html {
-        scroll-behavior: smooth;
-    }
-    
-    body {
-        font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-        background-color: var(--background);
-        color: var(--text-dark);
-        line-height: 1.6;
-    }
-    
-    /* ============================================================================
-       ACCESSIBILITY MODE
-       ============================================================================ */
-    
-    .accessibility-mode {
-        font-size: 18px !important;
-    }
-    
-    .high-contrast {
-        --primary-color: #000000;
-        --accent-color: #ffff00;
-        --background: #000000;
-        --card-bg: #ffffff;
-        --text-dark: #000000;
-    }
-    
-    /* ============================================================================
-       NAVIGATION BAR
-       ============================================================================ */
-    
-    .navbar-container {
-        background: linear-gradient(135deg, var(--primary-color) 0%, #2c5282 100%);
-        padding: 1.5rem 2rem;
-        border-bottom: 3px solid var(--accent-color);
-        margin-bottom: 2rem;
-        position: sticky;
-        top: 0;
-        z-index: 1000;
-        transition: box-shadow 0.3s ease;
-    }
-    
-    .navbar-container:hover {
-        box-shadow: 0 8px 16px rgba(0, 0, 0, 0.15);
-    }
-    
-    .navbar-title {
-        font-size: 2rem;
-        font-weight: 800;
-        color: #ffffff;
-        text-align: center;
-        letter-spacing: 0.5px;
-        text-shadow: 2px 2px 4px rgba(0, 0, 0, 0.2);
-    }
-    
-    .navbar-subtitle {
-        font-size: 0.9rem;
-        color: #e0e7ff;
-        text-align: center;
-        margin-top: 0.5rem;
-        font-weight: 500;
-    }
-    
-    /* ============================================================================
-       SEARCH SECTION
-       ============================================================================ */
-    
-    .search-container {
-        background: white;
-        padding: 2rem;
-        border-radius: 12px;
-        box-shadow: var(--shadow-md);
-        margin-bottom: 2rem;
-    }
-    
-    .search-input-wrapper {
-        position: relative;
-        margin-bottom: 1rem;
-    }
-    
-    .search-input-wrapper input {
-        width: 100%;
-        padding: 14px 20px;
-        font-size: 1rem;
-        border: 2px solid var(--border-light);
-        border-radius: 8px;
-        outline: none;
-        transition: all 0.3s ease;
-    }
-    
-    .search-input-wrapper input:focus {
-        border-color: var(--accent-color);
-        box-shadow: 0 0 0 3px rgba(255, 107, 53, 0.15);
-        transform: translateY(-2px);
-    }
-    
-    .search-input-wrapper input::placeholder {
-        color: var(--text-light);
-    }
-    
-    /* ============================================================================
-       BUTTONS WITH GRADIENT SWEEP
-       ============================================================================ */
-    
-    .button-group {
-        display: flex;
-        gap: 1rem;
-        flex-wrap: wrap;
-        justify-content: center;
-    }
-    
-    .btn {
-        padding: 12px 24px;
-        font-size: 0.95rem;
-        font-weight: 600;
-        border: none;
-        border-radius: 6px;
-        cursor: pointer;
-        transition: all 0.3s ease;
-        position: relative;
-        overflow: hidden;
-    }
-    
-    .btn-primary {
-        background: linear-gradient(90deg, var(--accent-color) 0%, var(--accent-light) 100%);
-        color: white;
-    }
-    
-    .btn-primary::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: -100%;
-        width: 100%;
-        height: 100%;
-        background: rgba(255, 255, 255, 0.2);
-        transition: left 0.5s ease;
-    }
-    
-    .btn-primary:hover::before {
-        left: 100%;
-    }
-    
-    .btn-primary:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 6px 12px rgba(255, 107, 53, 0.3);
-    }
-    
-    .btn-primary:active {
-        transform: translateY(0);
-    }
-    
-    .btn-secondary {
-        background-color: var(--border-light);
-        color: var(--text-dark);
-    }
-    
-    .btn-secondary:hover {
-        background-color: var(--text-light);
-        color: white;
-        transform: translateY(-2px);
-        box-shadow: var(--shadow-md);
-    }
-    
-    .btn-success {
-        background-color: var(--success-color);
-        color: white;
-    }
-    
-    .btn-success:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 6px 12px rgba(16, 185, 129, 0.3);
-    }
-    
-    /* ============================================================================
-       CATEGORY ICONS (WITH ROTATE & SCALE)
-       ============================================================================ */
-    
-    .category-row {
-        display: grid;
-        grid-template-columns: repeat(auto-fit, minmax(100px, 1fr));
-        gap: 1rem;
-        margin-bottom: 2rem;
-    }
-    
-    .category-item {
-        text-align: center;
-        cursor: pointer;
-        transition: all 0.3s ease;
-    }
-    
-    .category-icon {
-        width: 70px;
-        height: 70px;
-        background: linear-gradient(135deg, var(--primary-color), var(--accent-color));
-        border-radius: 50%;
-        display: flex;
-        align-items: center;
-        justify-content: center;
-        font-size: 2rem;
-        margin: 0 auto 0.5rem;
-        transition: all 0.4s cubic-bezier(0.34, 1.56, 0.64, 1);
-        position: relative;
-    }
-    
-    .category-icon::before {
-        content: '';
-        position: absolute;
-        inset: -4px;
-        background: radial-gradient(circle, rgba(255, 107, 53, 0.3), transparent);
-        border-radius: 50%;
-        opacity: 0;
-        transition: opacity 0.3s ease;
-    }
-    
-    .category-item:hover .category-icon {
-        transform: scale(1.15) rotate(360deg);
-        box-shadow: 0 8px 20px rgba(255, 107, 53, 0.4);
-    }
-    
-    .category-item:hover .category-icon::before {
-        opacity: 1;
-    }
-    
-    .category-label {
-        font-weight: 600;
-        font-size: 0.85rem;
-        color: var(--text-dark);
-        transition: color 0.3s ease;
-    }
-    
-    .category-item:hover .category-label {
-        color: var(--accent-color);
-    }
-    
-    /* ============================================================================
-       FILTER PANEL
-       ============================================================================ */
-    
-    .filter-panel {
-        background: white;
-        padding: 1.5rem;
-        border-radius: 10px;
-        box-shadow: var(--shadow-sm);
-        margin-bottom: 2rem;
-    }
-    
-    .filter-title {
-        font-size: 0.95rem;
-        font-weight: 700;
-        color: var(--primary-color);
-        margin-bottom: 0.8rem;
-        text-transform: uppercase;
-        letter-spacing: 0.5px;
-    }
-    
-    .filter-group {
-        margin-bottom: 1.2rem;
-    }
-    
-    .filter-group:last-child {
-        margin-bottom: 0;
-    }
-    
-    select {
-        width: 100%;
-        padding: 10px 14px;
-        border: 2px solid var(--border-light);
-        border-radius: 6px;
-        background-color: white;
-        font-size: 0.95rem;
-        color: var(--text-dark);
-        cursor: pointer;
-        transition: all 0.3s ease;
-        appearance: none;
-        padding-right: 30px;
-        background-image: url("data:image/svg+xml;charset=UTF-8,%3csvg xmlns='http://www.w3.org/2000/svg' viewBox='0 0 24 24' fill='none' stroke='%23333333' stroke-width='2' stroke-linecap='round' stroke-linejoin='round'%3e%3cpolyline points='6 9 12 15 18 9'%3e%3c/polyline%3e%3c/svg%3e");
-        background-repeat: no-repeat;
-        background-position: right 10px center;
-        background-size: 20px;
-    }
-    
-    select:focus {
-        border-color: var(--accent-color);
-        box-shadow: 0 0 0 3px rgba(255, 107, 53, 0.1);
-    }
-    
-    select:hover {
-        border-color: var(--accent-color);
-    }
-    
-    /* ============================================================================
-       SCHEME CARDS (MAIN - WITH SHADOW LIFT & ZOOM)
-       ============================================================================ */
-    
-    .scheme-card {
-        background: white;
-        border-left: 4px solid var(--accent-color);
-        border-radius: 8px;
-        padding: 1.5rem;
-        margin-bottom: 1.5rem;
-        box-shadow: var(--shadow-md);
-        transition: all 0.3s cubic-bezier(0.34, 1.56, 0.64, 1);
-        position: relative;
-    }
-    
-    .scheme-card:hover {
-        transform: translateY(-6px) scale(1.02);
-        box-shadow: 0 15px 30px rgba(0, 0, 0, 0.15);
-    }
-    
-    .scheme-header {
-        display: flex;
-        justify-content: space-between;
-        align-items: start;
-        margin-bottom: 1rem;
-    }
-    
-    .scheme-title {
-        font-size: 1.3rem;
-        font-weight: 700;
-        color: var(--primary-color);
-        flex: 1;
-        margin-right: 1rem;
-    }
-    
-    .scheme-status {
-        display: inline-block;
-        padding: 6px 12px;
-        background-color: var(--success-color);
-        color: white;
-        border-radius: 20px;
-        font-size: 0.8rem;
-        font-weight: 600;
-        white-space: nowrap;
-        animation: pulse 2s infinite;
-    }
-    
-    @keyframes pulse {
-        0%, 100% { opacity: 1; }
-        50% { opacity: 0.8; }
-    }
-    
-    .scheme-meta {
-        display: grid;
-        grid-template-columns: 1fr 1fr;
-        gap: 1rem;
-        margin-bottom: 1rem;
-    }
-    
-    .meta-item {
-        font-size: 0.9rem;
-        color: var(--text-light);
-    }
-    
-    .meta-label {
-        font-weight: 600;
-        color: var(--primary-color);
-        font-size: 0.8rem;
-        text-transform: uppercase;
-        letter-spacing: 0.3px;
-    }
-    
-    .meta-value {
-        margin-top: 0.3rem;
-        color: var(--text-dark);
-    }
-    
-    .scheme-benefit {
-        background: linear-gradient(135deg, rgba(255, 107, 53, 0.1), rgba(247, 147, 30, 0.1));
-        padding: 1rem;
-        border-left: 3px solid var(--accent-color);
-        border-radius: 6px;
-        margin: 1rem 0;
-        font-weight: 500;
-        color: var(--text-dark);
-    }
-    
-    .match-score {
-        display: flex;
-        align-items: center;
-        gap: 0.5rem;
-        margin-top: 1rem;
-        padding: 0.8rem;
-        background: #f0f9ff;
-        border-radius: 6px;
-        font-weight: 600;
-    }
-    
-    .match-score-bar {
-        flex: 1;
-        height: 8px;
-        background: var(--border-light);
-        border-radius: 4px;
-        overflow: hidden;
-    }
-    
-    .match-score-fill {
-        height: 100%;
-        background: linear-gradient(90deg, var(--success-color), var(--accent-color));
-        animation: fillBar 0.6s ease;
-    }
-    
-    @keyframes fillBar {
-        from { width: 0; }
-        to { width: var(--match-percentage); }
-    }
-    
-    .match-label {
-        font-size: 0.8rem;
-        color: var(--text-light);
-    }
-    
-    /* ============================================================================
-       EXPANDABLE SECTION (ELIGIBILITY)
-       ============================================================================ */
-    
-    .expandable-section {
-        margin-top: 1rem;
-        border-top: 1px solid var(--border-light);
-        padding-top: 1rem;
-    }
-    
-    .expand-button {
-        background: none;
-        border: none;
-        color: var(--accent-color);
-        cursor: pointer;
-        font-weight: 600;
-        font-size: 0.95rem;
-        padding: 0;
-        display: flex;
-        align-items: center;
-        gap: 0.5rem;
-        transition: all 0.3s ease;
-    }
-    
-    .expand-button:hover {
-        color: var(--accent-light);
-        gap: 1rem;
-    }
-    
-    .expand-icon {
-        transition: transform 0.3s ease;
-        display: inline-block;
-    }
-    
-    .expand-icon.open {
-        transform: rotate(180deg);
-    }
-    
-    .eligibility-content {
-        margin-top: 1rem;
-        padding: 1rem;
-        background: #f9fafb;
-        border-radius: 6px;
-        border-left: 3px solid var(--accent-color);
-        animation: slideDown 0.3s ease;
-    }
-    
-    @keyframes slideDown {
-        from {
-            opacity: 0;
-            transform: translateY(-10px);
-        }
-        to {
-            opacity: 1;
-            transform: translateY(0);
-        }
-    }
-    
-    /* ============================================================================
-       BUTTON GROUPS IN CARDS
-       ============================================================================ */
-    
-    .card-actions {
-        display: flex;
-        gap: 0.8rem;
-        margin-top: 1.2rem;
-        flex-wrap: wrap;
-    }
-    
-    .btn-small {
-        padding: 8px 16px;
-        font-size: 0.85rem;
-    }
-    
-    .btn-outline {
-        background: transparent;
-        border: 2px solid var(--accent-color);
-        color: var(--accent-color);
-        font-weight: 600;
-    }
-    
-    .btn-outline:hover {
-        background: var(--accent-color);
-        color: white;
-        transform: translateY(-2px);
-    }
-    
-    .btn-bookmark {
-        background: #fef3c7;
-        color: #92400e;
-        border: 2px solid #fcd34d;
-    }
-    
-    .btn-bookmark.bookmarked {
-        background: var(--accent-color);
-        color: white;
-        border-color: var(--accent-color);
-    }
-    
-    .btn-source {
-        background: linear-gradient(135deg, var(--primary-color), #2c5282);
-        color: white;
-    }
-    
-    .btn-source:hover {
-        box-shadow: 0 6px 12px rgba(26, 58, 82, 0.3);
-    }
-    
-    /* ============================================================================
-       EMPTY STATE
-       ============================================================================ */
+@st.cache_data(ttl=3600, show_spinner=False)
+def _explain_batch_cached(prompt: str, max_tokens: int) -> Dict[str, str]:
+    """
+    Batched explanation reply parsed into {scheme_id: explanation_text}, cached by prompt.
+    Raises on request errors and on replies that aren't the requested JSON, so neither is cached.
+    """
+    items = orjson.loads(_strip_code_fence(_call_azure_openai_uncached(prompt, max_tokens)))
+    return {str(item['id']): item['explanation'] for item in items}
+
+def generate_eligibility_explanations_batch(schemes: List[Dict], user_profile: str) -> Dict[str, str]:
+    """
+    Generate eligibility explanations for several schemes with one Azure OpenAI call per batch.
+    Helper for non-interactive callers (exports, precomputing); the UI streams
+    each card's explanation on demand instead.
+    Returns: {scheme_id: explanation_text}
+    """
+    if not all([AZURE_OPENAI_API_KEY, AZURE_OPENAI_ENDPOINT]):
+        return {scheme['id']: "⚠️ Azure OpenAI not configured. Please set your API credentials in .env file." for scheme in schemes}
     
-    .empty-state {
-        text-align: center;
-        padding: 3rem 2rem;
-        background: white;
-        border-radius: 10px;
-        box-shadow: var(--shadow-sm);
-    }
+    explanations = {}
     
-    .empty-icon {
-        font-size: 3rem;
-        margin-bottom: 1rem;
-    }
+    for start in range(0, len(schemes), EXPLANATION_BATCH_SIZE):
+        batch = schemes[start:start + EXPLANATION_BATCH_SIZE]
+        
+        scheme_blocks = "\n".join(
+            f"""
+    {num}. Scheme ID: {scheme['id']}
+       Scheme Name: {scheme['name']}
+       Ministry: {scheme['ministry']}
+       Beneficiary Type: {scheme['beneficiary']}
+       Benefit: {scheme['benefit']}"""
+            for num, scheme in enumerate(batch, 1)
+        )
+        
+        prompt = f"""
+    User Profile: {user_profile}
     
-    .empty-title {
-        font-size: 1.3rem;
-        font-weight: 700;
-        color: var(--primary-color);
-        margin-bottom: 0.5rem;
-    }
+    Schemes:
+    {scheme_blocks}
     
-    .empty-message {
-        color: var(--text-light);
-        font-size: 1rem;
-        margin-bottom: 1.5rem;
-    }
+    For each scheme above, based on the scheme details and user profile:
+    1. Briefly explain (2-3 sentences) why this user MIGHT be eligible
+    2. Mention any potential eligibility gaps
+    3. Suggest next steps
     
-    /* ============================================================================
-       DISCLAIMER & FOOTER
-       ============================================================================ */
-    
-    .disclaimer {
-        background: #fef3c7;
-        border-left: 4px solid #f59e0b;
-        padding: 1.2rem;
-        border-radius: 6px;
-        margin-bottom: 2rem;
-        font-size: 0.9rem;
-        color: #92400e;
-    }
+    Keep language simple and non-legal.
+    Return only JSON: [{{"id": "<scheme id>", "explanation": "<text>"}}, ...]
+    """
+        
+        fallback = "⚠️ Could not read AI explanation for this scheme."
+        
+        try:
+            batch_explanations = _explain_batch_cached(prompt, max_tokens=120 * len(batch))
+        except requests.exceptions.RequestException as e:
+            batch_explanations, fallback = {}, f"⚠️ Error calling Azure OpenAI: {str(e)}"
+        except (ValueError, TypeError, KeyError):
+            # The model ignored the JSON format
+            batch_explanations = {}
+        except Exception as e:
+            batch_explanations, fallback = {}, f"⚠️ Unexpected error: {str(e)}"
+        
+        for scheme in batch:
+            explanations[scheme['id']] = batch_explanations.get(scheme['id'], fallback)
     
-    .disclaimer-title {
-        font-weight: 700;
-        margin-bottom: 0.5rem;
-    }
+    return explanations
+
+async def _gather_eligibility_explanations(prompts: List[str]) -> List:
+    """Run all prompts concurrently over one multiplexed HTTP/2 connection; failures are returned, not raised."""
+    import httpx  # only needed on this path, so the app starts without it
     
-    .footer {
-        text-align: center;
-        padding: 2rem;
-        color: var(--text-light);
-        font-size: 0.9rem;
-        border-top: 1px solid var(--border-light);
-        margin-top: 3rem;
-    }
+    semaphore = asyncio.Semaphore(EXPLANATION_MAX_CONCURRENCY)
+    limits = httpx.Limits(max_connections=20, max_keepalive_connections=10)
     
-    /* ============================================================================
-       UNDERLINE REVEAL (using ::after)
-       ============================================================================ */
+    async with httpx.AsyncClient(http2=True, timeout=30, limits=limits) as client:
+        async def explain(prompt: str) -> str:
+            async with semaphore:
+                return await _call_azure_openai_async(client, prompt, max_tokens=150)
+        
+        return await asyncio.gather(*(explain(prompt) for prompt in prompts), return_exceptions=True)
+
+class _ExplanationsIncomplete(Exception):
+    """Some parallel explanation calls failed; carries the explanations that succeeded."""
     
-    .underline-reveal {
-        position: relative;
-        display: inline-block;
-    }
+    def __init__(self, explanations: Dict[str, str]):
+        super().__init__("Some eligibility explanation requests failed")
+        self.explanations = explanations
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _explain_schemes_parallel_cached(scheme_ids: tuple, user_profile: str) -> Dict[str, str]:
+    """
+    Per-scheme explanations fetched concurrently, cached by (scheme ids, profile).
+    Raises _ExplanationsIncomplete if any call failed, so partial results are never cached.
+    """
+    lookup = get_scheme_lookup()
+    prompts = [build_eligibility_prompt(lookup[scheme_id], user_profile) for scheme_id in scheme_ids]
+    replies = asyncio.run(_gather_eligibility_explanations(prompts))
     
-    .underline-reveal::after {
-        content: '';
-        position: absolute;
-        bottom: -2px;
-        left: 0;
-        width: 0;
-        height: 2px;
-        background-color: var(--accent-color);
-        transition: width 0.3s ease;
+    explanations = {
+        scheme_id: reply for scheme_id, reply in zip(scheme_ids, replies)
+        if not isinstance(reply, Exception)
     }
+    if len(explanations) < len(scheme_ids):
+        raise _ExplanationsIncomplete(explanations)
     
-    .underline-reveal:hover::after {
-        width: 100%;
-    }
+    return explanations
+
+def generate_eligibility_explanations_parallel(schemes: List[Dict], user_profile: str) -> Dict[str, Tuple[str, int]]:
+    """
+    Generate per-scheme eligibility explanations concurrently.
+    Returns: {scheme_id: (explanation_text, match_score_percentage)}
+    """
+    if not all([AZURE_OPENAI_API_KEY, AZURE_OPENAI_ENDPOINT]):
+        return {scheme['id']: generate_eligibility_explanation(scheme, user_profile) for scheme in schemes}
     
-    /* ============================================================================
-       RESPONSIVE DESIGN
-       ============================================================================ */
+    try:
+        explanations = _explain_schemes_parallel_cached(tuple(scheme['id'] for scheme in schemes), user_profile)
+    except _ExplanationsIncomplete as e:
+        explanations = e.explanations
+    except ImportError:  # httpx not installed: every scheme takes the sync path below
+        explanations = {}
     
-    @media (max-width: 768px) {
-        .navbar-title {
-            font-size: 1.5rem;
-        }
-        
-        .navbar-subtitle {
-            font-size: 0.8rem;
-        }
-        
-        .scheme-meta {
-            grid-template-columns: 1fr;
-        }
-        
-        .category-row {
-            grid-template-columns: repeat(3, 1fr);
-        }
-        
-        .scheme-header {
-            flex-direction: column;
-        }
-        
-        .scheme-status {
-            margin-top: 0.5rem;
-        }
-        
-        .search-container {
-            padding: 1.5rem 1rem;
-        }
-    }
+    profile_kw = profile_keywords(user_profile)
+    results = {}
     
-    @media (max-width: 480px) {
-        .navbar-container {
-            padding: 1rem;
-        }
-        
-        .navbar-title {
-            font-size: 1.3rem;
-        }
-        
-        .button-group {
-            gap: 0.5rem;
-        }
-        
-        .btn {
-            padding: 10px 16px;
-            font-size: 0.85rem;
-            flex: 1;
-        }
+    for scheme in schemes:
+        explanation = explanations.get(scheme['id'])
         
-        .category-row {
-            grid-template-columns: repeat(2, 1fr);
-        }
+        # Failed calls (e.g. throttling) go through the retrying, cached sync path
+        if explanation is None:
+            explanation = call_azure_openai(build_eligibility_prompt(scheme, user_profile), max_tokens=150)
         
-        .category-icon {
-            width: 60px;
-            height: 60px;
-            font-size: 1.5rem;
-        }
-    }
-    
-    /* ============================================================================
-       UTILITY CLASSES
-       ============================================================================ */
+        results[scheme['id']] = (explanation, calculate_match_score(scheme, profile_kw))
     
-    .text-center {
-        text-align: center;
-    }
-    
-    .mb-2 {
-        margin-bottom: 1rem;
-    }
-    
-    .mt-2 {
-        margin-top: 1rem;
-    }
+    return results
+
+@st.cache_resource(max_entries=256, show_spinner=False)
+def profile_keywords(user_profile: str) -> frozenset:
+    """
+    Match keywords in a user profile, cached across reruns. Compute once per
+    query and pass to calculate_match_score for every scheme.
+    """
+    return find_keywords(user_profile.lower())
+
+@st.cache_resource
+def get_keyword_matrix() -> np.ndarray:
+    """Keyword presence matrix: one row per scheme (in SCHEMES order), one column per match keyword."""
+    return np.array(
+        [[keyword in scheme['_keywords'] for keyword in MATCH_KEYWORDS] for scheme in load_schemes()],
+        dtype=np.uint8
+    ).reshape(-1, len(MATCH_KEYWORDS))
+
+def score_schemes(user_profile: str, rows: List[int]) -> np.ndarray:
+    """
+    Match percentage for the given rows of SCHEMES, in that order.
+    Same scoring as calculate_match_score, as a single matrix-vector product.
+    """
+    profile_kw = profile_keywords(user_profile)
+    profile_vector = np.array([keyword in profile_kw for keyword in MATCH_KEYWORDS], dtype=np.uint8)
+    matches = (get_keyword_matrix()[rows] @ profile_vector).astype(np.int32)
     
-    .hidden {
-        display: none;
-    }
+    return np.minimum(95, 50 + 5 * matches)
+
+def calculate_match_score(scheme: Dict, profile_kw: frozenset) -> int:
+    """Calculate match percentage based on keyword matching against precomputed profile_keywords()."""
+    matches = len(scheme['_keywords'] & profile_kw)
     
-    .flex-center {
-        display: flex;
-        align-items: center;
-        justify-content: center;
-    }
+    # Base score + keyword matches
+    base_score = 50
+    additional_score = matches * 5
     
-    .badge {
-        display: inline-block;
-        padding: 4px 8px;
-        background: var(--accent-color);
-        color: white;
-        border-radius: 4px;
-        font-size: 0.75rem;
-        font-weight: 600;
-        margin-right: 0.5rem;
-    }
+    return min(95, base_score + additional_score)  # Cap at 95%
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def compute_all_match_scores(scheme_ids: tuple, user_profile: str) -> Dict[str, int]:
+    """
+    Match percentage for each scheme in scheme_ids, without any AI call.
+    Only the requested rows are scored, in one vectorized product, so a page
+    of cards costs the same however large the catalogue grows.
+    """
+    positions = get_scheme_positions()
+    scores = score_schemes(user_profile, [positions[scheme_id] for scheme_id in scheme_ids])
     
-    .verified-badge {
-        display: inline-flex;
-        align-items: center;
-        gap: 0.3rem;
-        color: var(--success-color);
-        font-weight: 600;
-        font-size: 0.85rem;
-    }
+    return dict(zip(scheme_ids, scores.tolist()))
+
+# ============================================================================
+# UI STYLING (static/app.css)
+# ============================================================================
+
+def minify_css(css: str) -> str:
+    """Drop comments and layout whitespace from a stylesheet."""
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    css = re.sub(r'\s+', ' ', css)
     
-    </style>
+    return re.sub(r'\s*([{};,])\s*', r'\1', css).strip()
+
+@st.cache_resource
+def load_css() -> str:
     """
-    st.markdown(css, unsafe_allow_html=True)
+    Read and minify the app stylesheet once per process, ready to inject as a <style> block.
+    The block is re-sent on every rerun, so minifying here shrinks every rerun's payload.
+    """
+    try:
+        return f"<style>{minify_css(Path('static/app.css').read_text(encoding='utf-8'))}</style>"
+    except FileNotFoundError:
+        st.warning("⚠️ static/app.css not found. The app will use default styling.")
+        return ""
+
+def inject_css():
+    """
+    Inject custom CSS for modern UI with smooth animations.
+    Must run on every rerun: Streamlit drops elements a rerun doesn't re-emit.
+    """
+    css = load_css()
+    if css:
+        st.markdown(css, unsafe_allow_html=True)
+
+# ============================================================================
+# STATIC HTML
+# ============================================================================
+
+# Markup that never changes between reruns lives here as plain, pre-dedented
+# literals so render functions just hand them to st.markdown.
+
+# Top navigation bar
+_NAVBAR_HTML = """<div class="navbar-container">
+    <div class="navbar-title">🏛️ SchemeMitra</div>
+    <div class="navbar-subtitle">AI-Powered Government Scheme Finder</div>
+</div>"""
+
+# Disclaimer banner
+_DISCLAIMER_HTML = """<div class="disclaimer">
+    <div class="disclaimer-title">⚠️ Important Disclaimer</div>
+    <div>
+        SchemeMitra is an independent application and is <strong>NOT an official government portal</strong>.
+        This platform provides guidance only. Always verify information on official government portals.
+        We are not responsible for inaccuracies. Consult official government offices for clarification.
+    </div>
+</div>"""
+
+# Page footer
+_FOOTER_HTML = """<div class="footer">
+    <p><strong>🏛️ SchemeMitra</strong> © 2026 - AI Government Scheme Finder</p>
+    <p>Built with ❤️ for the Imagine Cup | Data from official government portals</p>
+    <p style="font-size: 0.8rem; margin-top: 1rem; color: #999;">
+        This is an educational MVP and not officially affiliated with the Government of India.
+    </p>
+</div>"""
+
+# Category selector heading
+_CATEGORY_HEADER_HTML = """<div style="text-align: center; margin-bottom: 1.5rem;">
+    <p style="font-weight: 700; color: #1a3a52; margin-bottom: 1rem;">Browse by Category</p>
+</div>"""
+
+# Search section heading
+_SEARCH_HEADER_HTML = """<div class="search-container">
+    <p style="font-size: 1.1rem; font-weight: 700; color: #1a3a52; margin-bottom: 1rem;">
+        🔍 Find Your Perfect Scheme
+    </p>
+</div>"""
+
+# Filter panel heading
+_FILTERS_HEADER_HTML = """<div style="margin-bottom: 2rem; font-weight: 700; color: #1a3a52; font-size: 1.1rem;">
+    ⚙️ Refine Your Search
+</div>"""
+
+# Bookmarked schemes heading
+_BOOKMARKS_HEADER_HTML = """<div style="margin-bottom: 2rem; margin-top: 2rem;">
+    <h2 style="color: #1a3a52; border-bottom: 3px solid #ff6b35; padding-bottom: 0.5rem;">
+        ⭐ My Bookmarked Schemes
+    </h2>
+</div>"""
+
+# Feedback prompt
+_FEEDBACK_HEADER_HTML = """<div style="background: #f0f9ff; padding: 1.5rem; border-radius: 10px; border-left: 4px solid #3b82f6; margin-top: 2rem;">
+    <p style="font-weight: 700; color: #1a3a52; margin-bottom: 0.5rem;">📝 Was this helpful?</p>
+</div>"""
+
+# Intro tagline
+_INTRO_HTML = """<div style="text-align: center; margin-bottom: 2rem;">
+    <p style="font-size: 1.1rem; color: #666666; font-weight: 500;">
+        🎯 Discover government schemes tailored to your profile
+    </p>
+</div>"""
+
+# Results heading
+_RESULTS_HEADER_HTML = """<div style="margin-bottom: 2rem; margin-top: 2rem;">
+    <h2 style="color: #1a3a52; border-bottom: 3px solid #ff6b35; padding-bottom: 0.5rem;">
+        🎯 Available Schemes
+    </h2>
+</div>"""
+
+# Empty results state
+_EMPTY_STATE_HTML = """<div class="empty-state">
+    <div class="empty-icon">🔍</div>
+    <div class="empty-title">No Schemes Found</div>
+    <div class="empty-message">
+        Try adjusting your filters or search terms. You can also:<br>
+        • Remove filters to see all schemes<br>
+        • Try different keywords<br>
+        • Browse by category above
+    </div>
+</div>"""
+
+# Eligibility explanation box; filled with the (partial) explanation text via str.format
+_ELIGIBILITY_HTML = """<div class="eligibility-content">
+    <strong>Why you might be eligible:</strong><br>
+    {}
+</div>"""
+
+# Sidebar About / Privacy / Help panel, kept as one module-level HTML block
+_SIDEBAR_ABOUT_HTML = """<h3>📱 About SchemeMitra</h3>
+<p>AI-powered scheme discovery using:</p>
+<ul>
+    <li><strong>Azure OpenAI</strong> for intelligent matching</li>
+    <li><strong>Text Analytics</strong> for input analysis</li>
+    <li><strong>Real government data</strong> from official portals</li>
+</ul>
+<h3>🔐 Privacy</h3>
+<ul>
+    <li>No login required</li>
+    <li>No personal data stored</li>
+    <li>Session-based bookmarks only</li>
+    <li>No external tracking</li>
+</ul>
+<h3>📚 Need Help?</h3>
+<ul>
+    <li>Check official scheme sources</li>
+    <li>Contact government offices directly</li>
+    <li>Review application disclaimers</li>
+</ul>"""
 
 # ============================================================================
 # UI COMPONENTS
@@ -973,65 +742,25 @@ def inject_css():
 
 def render_navbar():
     """Render the top navigation bar."""
-    navbar_html = """
-    <div class="navbar-container">
-        <div class="navbar-title">🏛️ SchemeMitra</div>
-        <div class="navbar-subtitle">AI-Powered Government Scheme Finder</div>
-    </div>
-    """
-    st.markdown(navbar_html, unsafe_allow_html=True)
+    st.markdown(_NAVBAR_HTML, unsafe_allow_html=True)
 
 def render_disclaimer():
     """Render the important disclaimer."""
-    disclaimer_html = """
-    <div class="disclaimer">
-        <div class="disclaimer-title">⚠️ Important Disclaimer</div>
-        <div>
-            SchemeMitra is an independent application and is <strong>NOT an official government portal</strong>.
-            This platform provides guidance only. Always verify information on official government portals.
-            We are not responsible for inaccuracies. Consult official government offices for clarification.
-        </div>
-    </div>
-    """
-    st.markdown(disclaimer_html, unsafe_allow_html=True)
+    st.markdown(_DISCLAIMER_HTML, unsafe_allow_html=True)
 
 def render_category_selector():
     """Render category selector with circular icons."""
-    col1, col2, col3 = st.columns([1, 1, 1])
-    
-    category_cols = {
-        'Farmers': col1,
-        'Women': col2,
-        'Youth': col3,
-        'MSME': col1,
-        'Education': col2,
-        'Senior Citizens': col3
-    }
-    
-    st.markdown("""
-    <div style="text-align: center; margin-bottom: 1.5rem;">
-        <p style="font-weight: 700; color: #1a3a52; margin-bottom: 1rem;">Browse by Category</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_CATEGORY_HEADER_HTML, unsafe_allow_html=True)
     
-    for idx, category in enumerate(CATEGORY_NAMES):
-        if idx % 3 == 0:
-            col1, col2, col3 = st.columns([1, 1, 1])
-        
-        cols = [col1, col2, col3]
-        with cols[idx % 3]:
+    # One row of columns for all categories
+    for column, category in zip(st.columns(len(CATEGORY_NAMES)), CATEGORY_NAMES):
+        with column:
             if st.button(f"{CATEGORIES[category]}\n{category}", key=f"cat_{category}", use_container_width=True):
                 st.session_state.selected_category = category
 
 def render_search_section():
     """Render the search section with input and filters."""
-    st.markdown("""
-    <div class="search-container">
-        <p style="font-size: 1.1rem; font-weight: 700; color: #1a3a52; margin-bottom: 1rem;">
-            🔍 Find Your Perfect Scheme
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_SEARCH_HEADER_HTML, unsafe_allow_html=True)
     
     col1, col2 = st.columns([4, 1])
     
@@ -1049,25 +778,21 @@ def render_search_section():
 
 def render_filters():
     """Render filter panel."""
-    st.markdown("""
-    <div style="margin-bottom: 2rem; font-weight: 700; color: #1a3a52; font-size: 1.1rem;">
-        ⚙️ Refine Your Search
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_FILTERS_HEADER_HTML, unsafe_allow_html=True)
     
     col1, col2, col3 = st.columns(3)
     
     with col1:
         selected_ministry = st.selectbox(
             "Ministry / Department",
-            options=["All Ministries"] + sorted(set(s['ministry'] for s in SCHEMES)),
+            options=MINISTRY_OPTIONS,
             key="filter_ministry"
         )
     
     with col2:
         selected_beneficiary = st.selectbox(
             "Beneficiary Type",
-            options=["All Types"] + sorted(set(s['beneficiary'] for s in SCHEMES)),
+            options=BENEFICIARY_OPTIONS,
             key="filter_beneficiary"
         )
     
@@ -1080,119 +805,177 @@ def render_filters():
     
     return selected_ministry, selected_beneficiary, selected_category
 
-def render_scheme_card(scheme: Dict, idx: int):
-    """Render a single scheme card with all features."""
-    is_bookmarked = scheme['id'] in st.session_state.bookmarked_schemes
-    is_expanded = scheme['id'] in st.session_state.expanded_schemes
+def _toggle_expanded(scheme_id: str):
+    """Button callback: show or hide a scheme's eligibility explanation."""
+    if scheme_id in st.session_state.expanded_schemes:
+        st.session_state.expanded_schemes.discard(scheme_id)
+    else:
+        st.session_state.expanded_schemes.add(scheme_id)
+
+def _toggle_bookmark(scheme_id: str):
+    """Button callback: add or remove a scheme from the bookmarks."""
+    if scheme_id in st.session_state.bookmarked_schemes:
+        st.session_state.bookmarked_schemes.discard(scheme_id)
+    else:
+        st.session_state.bookmarked_schemes.add(scheme_id)
+
+def _build_card_html(scheme: Dict, match_score: int) -> str:
+    """
+    Build the static HTML for a scheme card (title, meta, benefit, match bar, source link).
+    Adjacent literals join at compile time into one f-string, so the markup ships
+    without the indentation and blank lines of a triple-quoted block.
+    """
+    return (
+        f'<div class="scheme-card" id="scheme_{scheme["id"]}">'
+            '<div class="scheme-header">'
+                f'<div class="scheme-title">{scheme["name"]}</div>'
+                '<div class="scheme-status">✓ Active</div>'
+            '</div>'
+            '<div class="scheme-meta">'
+                '<div class="meta-item">'
+                    '<div class="meta-label">📍 Ministry</div>'
+                    f'<div class="meta-value">{scheme["ministry"]}</div>'
+                '</div>'
+                '<div class="meta-item">'
+                    '<div class="meta-label">👥 Beneficiary</div>'
+                    f'<div class="meta-value">{scheme["beneficiary"]}</div>'
+                '</div>'
+            '</div>'
+            f'<div class="scheme-benefit">💰 <strong>Benefit:</strong> {scheme["benefit"]}</div>'
+            '<div class="match-score">'
+                '<span class="match-label">Eligibility Match:</span>'
+                f'<div class="match-score-bar" style="--match-percentage: {match_score}%">'
+                    '<div class="match-score-fill"></div>'
+                '</div>'
+                f'<span style="font-weight: 700; color: #10b981; min-width: 45px;">{match_score}%</span>'
+            '</div>'
+            f'<a href="{scheme["source_url"]}" target="_blank" class="btn btn-small btn-source" '
+                'style="display: block; margin-top: 1rem; text-align: center; text-decoration: none; color: white;">'
+                '🔗 Official Source'
+            '</a>'
+        '</div>'
+    )
+
+def _render_card_buttons(scheme: Dict, is_bookmarked: bool, key_prefix: str = ""):
+    """Render the interactive row under a card: eligibility and bookmark."""
+    # Expandable eligibility section; the Official Source link is part of the card HTML
+    col1, col2 = st.columns(2)
     
-    # Create unique key for expand button
-    expand_key = f"expand_{scheme['id']}"
+    with col1:
+        # State changes happen in on_click callbacks, which run before the
+        # rerun triggered by the click, so no extra st.rerun() is needed
+        st.button("💡 Why I'm Eligible", key=f"{key_prefix}expand_{scheme['id']}", use_container_width=True,
+                  on_click=_toggle_expanded, args=(scheme['id'],))
     
-    # Determine match score
-    user_profile = st.session_state.get('last_user_profile', 'General user')
-    _, match_score = generate_eligibility_explanation(scheme, user_profile)
+    with col2:
+        st.button(f"{'⭐ Bookmarked' if is_bookmarked else '☆ Bookmark'}", 
+                  key=f"{key_prefix}bookmark_{scheme['id']}", use_container_width=True,
+                  on_click=_toggle_bookmark, args=(scheme['id'],))
+
+def _stream_eligibility_explanation(scheme: Dict, user_profile: str, placeholder) -> Tuple[str, bool]:
+    """
+    Stream the eligibility explanation into placeholder as it arrives.
+    Returns: (explanation_text, complete). On failure the warning is appended to
+    whatever text already arrived and complete is False, so it is not cached.
+    """
+    if not all([AZURE_OPENAI_API_KEY, AZURE_OPENAI_ENDPOINT]):
+        explanation = "⚠️ Azure OpenAI not configured. Please set your API credentials in .env file."
+        placeholder.markdown(_ELIGIBILITY_HTML.format(explanation), unsafe_allow_html=True)
+        return explanation, False
     
-    card_html = f"""
-    <div class="scheme-card" id="scheme_{scheme['id']}">
-        <div class="scheme-header">
-            <div class="scheme-title">{scheme['name']}</div>
-            <div class="scheme-status">✓ Active</div>
-        </div>
-        
-        <div class="scheme-meta">
-            <div class="meta-item">
-                <div class="meta-label">📍 Ministry</div>
-                <div class="meta-value">{scheme['ministry']}</div>
-            </div>
-            <div class="meta-item">
-                <div class="meta-label">👥 Beneficiary</div>
-                <div class="meta-value">{scheme['beneficiary']}</div>
-            </div>
-        </div>
-        
-        <div class="scheme-benefit">
-            💰 <strong>Benefit:</strong> {scheme['benefit']}
-        </div>
-        
-        <div class="match-score">
-            <span class="match-label">Eligibility Match:</span>
-            <div class="match-score-bar" style="--match-percentage: {match_score}%">
-                <div class="match-score-fill"></div>
-            </div>
-            <span style="font-weight: 700; color: #10b981; min-width: 45px;">{match_score}%</span>
-        </div>
-    </div>
+    explanation = ""
+    try:
+        for chunk in generate_eligibility_explanation_stream(scheme, user_profile):
+            explanation += chunk
+            placeholder.markdown(_ELIGIBILITY_HTML.format(explanation), unsafe_allow_html=True)
+        return explanation, True
+    
+    except requests.exceptions.RequestException as e:
+        explanation += f"⚠️ Error calling Azure OpenAI: {str(e)}"
+    except Exception as e:
+        explanation += f"⚠️ Unexpected error: {str(e)}"
+    
+    placeholder.markdown(_ELIGIBILITY_HTML.format(explanation), unsafe_allow_html=True)
+    return explanation, False
+
+def render_scheme_card(scheme: Dict, idx: int, match_score: int,
+                       is_bookmarked: bool, is_expanded: bool, key_prefix: str = ""):
+    """Render a single scheme card with all features.
+    
+    match_score comes from compute_all_match_scores() for the whole list, and
+    is_bookmarked / is_expanded from the caller's session-state set lookups.
+    key_prefix keeps widget keys unique when the same scheme is rendered in
+    more than one section (e.g. results and bookmarks).
     """
+    st.markdown(_build_card_html(scheme, match_score), unsafe_allow_html=True)
+    _render_card_buttons(scheme, is_bookmarked, key_prefix)
     
-    st.markdown(card_html, unsafe_allow_html=True)
+    # Show eligibility explanation if expanded
+    if is_expanded:
+        user_profile = st.session_state.get('last_user_profile', 'General user')
+        explanations = st.session_state.explanations
+        explanation_key = (scheme['id'], user_profile)
+        
+        explanation = explanations.get(explanation_key)
+        placeholder = st.empty()
+        
+        if explanation is None:
+            # Stream the first view into the box so text shows up as soon as the model starts answering
+            explanation, complete = _stream_eligibility_explanation(scheme, user_profile, placeholder)
+            
+            # Only answers that reached [DONE] are kept; failures are retried on the next rerun
+            if complete and explanation:
+                explanations[explanation_key] = explanation
+        else:
+            placeholder.markdown(_ELIGIBILITY_HTML.format(explanation), unsafe_allow_html=True)
     
-    # Expandable eligibility section
-    col1, col2, col3 = st.columns([1, 1, 1])
+    st.divider()
+
+def _set_page(page: int):
+    """Button callback: jump to a results page."""
+    st.session_state.page = page
+
+def render_pagination(page: int, page_count: int):
+    """Render previous/next controls for the results list."""
+    col1, col2, col3 = st.columns([1, 2, 1])
     
     with col1:
-        if st.button("💡 Why I'm Eligible", key=f"expand_{scheme['id']}", use_container_width=True):
-            if scheme['id'] in st.session_state.expanded_schemes:
-                st.session_state.expanded_schemes.remove(scheme['id'])
-            else:
-                st.session_state.expanded_schemes.append(scheme['id'])
-            st.rerun()
+        st.button("⬅️ Previous", key="page_prev", use_container_width=True,
+                  disabled=page == 0, on_click=_set_page, args=(page - 1,))
     
     with col2:
-        if st.button(f"{'⭐ Bookmarked' if is_bookmarked else '☆ Bookmark'}", 
-                     key=f"bookmark_{scheme['id']}", use_container_width=True):
-            if is_bookmarked:
-                st.session_state.bookmarked_schemes.remove(scheme['id'])
-            else:
-                st.session_state.bookmarked_schemes.append(scheme['id'])
-            st.rerun()
-    
-    with col3:
         st.markdown(f"""
-        <a href="{scheme['source_url']}" target="_blank" style="text-decoration: none; width: 100%; display: block;">
-            <button class="btn btn-small btn-source" style="width: 100%; padding: 8px 16px; font-size: 0.85rem; font-weight: 600; border: none; border-radius: 6px; cursor: pointer; background: linear-gradient(135deg, #1a3a52, #2c5282); color: white; transition: all 0.3s ease;">
-                🔗 Official Source
-            </button>
-        </a>
+        <div style="text-align: center; font-weight: 600; color: #1a3a52; padding-top: 0.5rem;">
+            Page {page + 1} of {page_count}
+        </div>
         """, unsafe_allow_html=True)
     
-    # Show eligibility explanation if expanded
-    if scheme['id'] in st.session_state.expanded_schemes:
-        with st.spinner("✨ Generating AI explanation..."):
-            explanation, _ = generate_eligibility_explanation(scheme, user_profile)
-            
-            eligibility_html = f"""
-            <div class="eligibility-content">
-                <strong>Why you might be eligible:</strong><br>
-                {explanation}
-            </div>
-            """
-            st.markdown(eligibility_html, unsafe_allow_html=True)
-    
-    st.divider()
+    with col3:
+        st.button("Next ➡️", key="page_next", use_container_width=True,
+                  disabled=page == page_count - 1, on_click=_set_page, args=(page + 1,))
 
 def render_bookmarked_schemes():
     """Render bookmarked schemes section."""
-    if st.session_state.bookmarked_schemes:
-        st.markdown("""
-        <div style="margin-bottom: 2rem; margin-top: 2rem;">
-            <h2 style="color: #1a3a52; border-bottom: 3px solid #ff6b35; padding-bottom: 0.5rem;">
-                ⭐ My Bookmarked Schemes
-            </h2>
-        </div>
-        """, unsafe_allow_html=True)
+    bookmarked_ids = st.session_state.bookmarked_schemes
+    expanded = st.session_state.expanded_schemes
+    
+    if bookmarked_ids:
+        st.markdown(_BOOKMARKS_HEADER_HTML, unsafe_allow_html=True)
         
-        bookmarked = [s for s in SCHEMES if s['id'] in st.session_state.bookmarked_schemes]
+        # Walk the catalogue rather than the set so bookmarks keep catalogue order
+        bookmarked = [s for s in SCHEMES if s['id'] in bookmarked_ids]
+        match_scores = compute_all_match_scores(
+            tuple(s['id'] for s in bookmarked),
+            st.session_state.get('last_user_profile', 'General user')
+        )
         
         for scheme in bookmarked:
-            render_scheme_card(scheme, 0)
+            render_scheme_card(scheme, 0, match_scores[scheme['id']], True,
+                               scheme['id'] in expanded, key_prefix="bookmarked_")
 
 def render_feedback_section():
     """Render feedback section."""
-    st.markdown("""
-    <div style="background: #f0f9ff; padding: 1.5rem; border-radius: 10px; border-left: 4px solid #3b82f6; margin-top: 2rem;">
-        <p style="font-weight: 700; color: #1a3a52; margin-bottom: 0.5rem;">📝 Was this helpful?</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_FEEDBACK_HEADER_HTML, unsafe_allow_html=True)
     
     col1, col2, col3 = st.columns([1, 1, 1])
     
@@ -1210,55 +993,115 @@ def render_feedback_section():
 
 def render_footer():
     """Render footer."""
-    footer_html = """
-    <div class="footer">
-        <p><strong>🏛️ SchemeMitra</strong> © 2026 - AI Government Scheme Finder</p>
-        <p>Built with ❤️ for the Imagine Cup | Data from official government portals</p>
-        <p style="font-size: 0.8rem; margin-top: 1rem; color: #999;">
-            This is an educational MVP and not officially affiliated with the Government of India.
-        </p>
-    </div>
-    """
-    st.markdown(footer_html, unsafe_allow_html=True)
+    st.markdown(_FOOTER_HTML, unsafe_allow_html=True)
 
 # ============================================================================
 # FILTERING & SEARCH LOGIC
 # ============================================================================
 
-def filter_schemes(schemes: List[Dict], 
-                  search_query: str = "",
-                  ministry_filter: str = "All Ministries",
-                  beneficiary_filter: str = "All Types",
-                  category_filter: str = "All Categories") -> List[Dict]:
+@st.cache_resource
+def get_schemes_frame() -> pd.DataFrame:
+    """
+    Schemes as a DataFrame (rows in SCHEMES order) with a pre-lowercased search blob,
+    built once per process for vectorized filtering.
+    """
+    frame = pd.DataFrame(load_schemes(), columns=['id', 'name', 'description', 'ministry', 'beneficiary', 'category'])
+    
+    # Newline-joined so a query (single-line text input) can never match across two fields
+    frame['_blob'] = (
+        frame['name'] + '\n' + frame['description'] + '\n' +
+        frame['ministry'] + '\n' + frame['beneficiary']
+    ).str.lower()
+    
+    return frame
+
+@st.cache_resource
+def get_trigram_index() -> Dict[str, frozenset]:
     """
-    Filter schemes based on search query and filters.
+    Map each 3-character window of the lowercased search blob to the
+    row positions (in SCHEMES order) whose text contains it.
     """
-    filtered = schemes.copy()
+    postings = {}
+    
+    for position, text in enumerate(get_schemes_frame()['_blob']):
+        for i in range(len(text) - 2):
+            postings.setdefault(text[i:i + 3], set()).add(position)
+    
+    return {trigram: frozenset(positions) for trigram, positions in postings.items()}
+
+def _contains_query(rows: pd.DataFrame, search_lower: str) -> np.ndarray:
+    """Rows whose name, description, ministry or beneficiary contains search_lower."""
+    return rows['_blob'].str.contains(search_lower, regex=False).to_numpy()
+
+def _search_mask(frame: pd.DataFrame, search_lower: str) -> np.ndarray:
+    """
+    Rows whose name, description, ministry or beneficiary contains the query.
+    Queries of 3+ characters only scan the rows that contain all of the query's trigrams.
+    """
+    # Short queries have no trigrams to narrow by; scan the frame itself, not a copy of every row
+    if len(search_lower) < 3:
+        return _contains_query(frame, search_lower)
+    
+    index = get_trigram_index()
+    candidates = frozenset.intersection(*(
+        index.get(search_lower[i:i + 3], frozenset()) for i in range(len(search_lower) - 2)
+    ))
+    
+    mask = np.zeros(len(frame), dtype=bool)
+    if candidates:
+        positions = sorted(candidates)
+        mask[positions] = _contains_query(frame.iloc[positions], search_lower)
+    
+    return mask
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def _filter_scheme_positions(search_query: str,
+                             ministry_filter: str,
+                             beneficiary_filter: str,
+                             category_filter: str) -> Tuple[int, ...]:
+    """
+    Positions in SCHEMES matching the search query and filters.
+    Cached by the filter values, so reruns that leave them untouched skip the scan.
+    """
+    frame = get_schemes_frame()
+    
+    # One boolean array narrowed in place, rather than a new Series per filter
+    mask = np.ones(len(frame), dtype=bool)
     
     # Search filter
     if search_query:
-        search_lower = search_query.lower()
-        filtered = [
-            s for s in filtered
-            if (search_lower in s['name'].lower() or
-                search_lower in s['description'].lower() or
-                search_lower in s['ministry'].lower() or
-                search_lower in s['beneficiary'].lower())
-        ]
+        mask &= _search_mask(frame, search_query.lower())
     
     # Ministry filter
     if ministry_filter != "All Ministries":
-        filtered = [s for s in filtered if s['ministry'] == ministry_filter]
+        mask &= frame['ministry'].to_numpy() == ministry_filter
     
     # Beneficiary filter
     if beneficiary_filter != "All Types":
-        filtered = [s for s in filtered if s['beneficiary'] == beneficiary_filter]
+        mask &= frame['beneficiary'].to_numpy() == beneficiary_filter
     
     # Category filter
     if category_filter != "All Categories":
-        filtered = [s for s in filtered if s['category'] == category_filter]
+        mask &= frame['category'].to_numpy() == category_filter
+    
+    return tuple(np.flatnonzero(mask).tolist())
+
+def filter_schemes(search_query: str = "",
+                   ministry_filter: str = "All Ministries",
+                   beneficiary_filter: str = "All Types",
+                   category_filter: str = "All Categories") -> List[Dict]:
+    """
+    Filter SCHEMES based on search query and filters.
+    With no filter active this returns SCHEMES itself, which must not be mutated.
+    """
+    # Nothing to filter: skip the cache lookup and the scan entirely
+    if (not search_query and ministry_filter == "All Ministries"
+            and beneficiary_filter == "All Types" and category_filter == "All Categories"):
+        return SCHEMES
+    
+    positions = _filter_scheme_positions(search_query, ministry_filter, beneficiary_filter, category_filter)
     
-    return filtered
+    return [SCHEMES[position] for position in positions]
 
 # ============================================================================
 # MAIN APPLICATION
@@ -1297,37 +1140,13 @@ def main():
         
         st.divider()
         
-        st.markdown("""
-        ### 📱 About SchemeMitra
-        
-        AI-powered scheme discovery using:
-        - **Azure OpenAI** for intelligent matching
-        - **Text Analytics** for input analysis
-        - **Real government data** from official portals
-        
-        ### 🔐 Privacy
-        - No login required
-        - No personal data stored
-        - Session-based bookmarks only
-        - No external tracking
-        
-        ### 📚 Need Help?
-        - Check official scheme sources
-        - Contact government offices directly
-        - Review application disclaimers
-        """)
+        st.markdown(_SIDEBAR_ABOUT_HTML, unsafe_allow_html=True)
     
     # Main content
     col1, col2 = st.columns([3, 1])
     
     with col1:
-        st.markdown("""
-        <div style="text-align: center; margin-bottom: 2rem;">
-            <p style="font-size: 1.1rem; color: #666666; font-weight: 500;">
-                🎯 Discover government schemes tailored to your profile
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(_INTRO_HTML, unsafe_allow_html=True)
     
     # Search section
     search_query, search_button = render_search_section()
@@ -1365,46 +1184,52 @@ def main():
     selected_category = st.session_state.get('selected_category', selected_category)
     
     # Filter schemes
+    search_query = search_query if search_button or search_query else ""
     filtered_schemes = filter_schemes(
-        SCHEMES,
-        search_query=search_query if search_button or search_query else "",
+        search_query=search_query,
         ministry_filter=selected_ministry,
         beneficiary_filter=selected_beneficiary,
         category_filter=selected_category
     )
     
-    # Display results
-    st.markdown("""
-    <div style="margin-bottom: 2rem; margin-top: 2rem;">
-        <h2 style="color: #1a3a52; border-bottom: 3px solid #ff6b35; padding-bottom: 0.5rem;">
-            🎯 Available Schemes
-        </h2>
-    </div>
-    """, unsafe_allow_html=True)
+    # Go back to the first page whenever the filters change
+    active_filters = (search_query, selected_ministry, selected_beneficiary, selected_category)
+    if st.session_state.get('page_filters') != active_filters:
+        st.session_state.page_filters = active_filters
+        st.session_state.page = 0
     
+    # Display results; the heading shares one markdown call with whatever follows it
     if filtered_schemes:
-        st.markdown(f"""
+        st.markdown(_RESULTS_HEADER_HTML + f"""
         <div style="padding: 0.8rem; background: #f0f9ff; border-radius: 6px; margin-bottom: 1.5rem; text-align: center; font-weight: 600; color: #0369a1;">
             Found {len(filtered_schemes)} scheme(s) matching your criteria
         </div>
         """, unsafe_allow_html=True)
         
-        for idx, scheme in enumerate(filtered_schemes, 1):
-            render_scheme_card(scheme, idx)
+        # Only the current page is scored and rendered
+        page_count = -(-len(filtered_schemes) // RESULTS_PAGE_SIZE)
+        page = min(st.session_state.page, page_count - 1)
+        start = page * RESULTS_PAGE_SIZE
+        visible_schemes = filtered_schemes[start:start + RESULTS_PAGE_SIZE]
+        
+        # Score the whole page in one pass before rendering any card
+        match_scores = compute_all_match_scores(
+            tuple(s['id'] for s in visible_schemes),
+            st.session_state.last_user_profile
+        )
+        
+        bookmarked = st.session_state.bookmarked_schemes
+        expanded = st.session_state.expanded_schemes
+        
+        for idx, scheme in enumerate(visible_schemes, start + 1):
+            render_scheme_card(scheme, idx, match_scores[scheme['id']],
+                               scheme['id'] in bookmarked, scheme['id'] in expanded)
+        
+        if page_count > 1:
+            render_pagination(page, page_count)
     
     else:
-        st.markdown("""
-        <div class="empty-state">
-            <div class="empty-icon">🔍</div>
-            <div class="empty-title">No Schemes Found</div>
-            <div class="empty-message">
-                Try adjusting your filters or search terms. You can also:<br>
-                • Remove filters to see all schemes<br>
-                • Try different keywords<br>
-                • Browse by category above
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(_RESULTS_HEADER_HTML + _EMPTY_STATE_HTML, unsafe_allow_html=True)
     
     st.divider()
     